@@ -0,0 +1,284 @@
+# benchmarks/transport_benchmark.py
+"""Бенчмарк накладних витрат HTTP-транспорту для Bot API і Gemini.
+
+Піднімає локальні TLS-заглушки (Bot API на aiohttp, Gemini REST на aiohttp і Gemini gRPC),
+після чого для кожної конфігурації міряє:
+  - cold: перший запит після створення клієнта (з прогрівом, якщо він є в конфігурації);
+  - seq:  середня затримка послідовних запитів;
+  - burst p50/p95: затримки пачки паралельних запитів.
+Колонки показують накладні витрати — затримку мінус штучна затримка сервера.
+
+Запуск: python benchmarks/transport_benchmark.py [--requests 50] [--burst 64] [--server-delay 0.02]
+Потрібен openssl у PATH для генерації самопідписаного сертифіката.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import argparse
+import asyncio
+import json
+import ssl
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+import grpc
+from aiohttp import web
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from google.ai import generativelanguage_v1beta as glm
+from google.ai.generativelanguage_v1beta.services.generative_service.transports import (
+    GenerativeServiceGrpcAsyncIOTransport,
+    GenerativeServiceRestTransport,
+)
+from google.auth.credentials import AnonymousCredentials
+
+from services.transport_service import TunedAiohttpSession, make_gemini_transport, warm_up_bot
+
+HOST = "127.0.0.1"
+BOT_TOKEN = "42:BENCHMARK"
+GRPC_SERVICE = "google.ai.generativelanguage.v1beta.GenerativeService"
+GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 30000,
+    "grpc.keepalive_timeout_ms": 10000,
+    "grpc.keepalive_permit_without_calls": 1,
+    "grpc.http2.max_pings_without_data": 0,
+}
+
+
+def make_certificate(directory: str) -> tuple[str, str]:
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-keyout", key, "-out", cert, "-subj", "/CN=localhost",
+            "-addext", f"subjectAltName=DNS:localhost,IP:{HOST}",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+# --- Локальні заглушки ---
+
+async def start_http_stub(cert: str, key: str, delay: float) -> tuple[web.AppRunner, int]:
+    """Один aiohttp-сервер відповідає і як Bot API, і як Gemini REST."""
+    async def bot_api(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        result = {"id": 42, "is_bot": True, "first_name": "Stub", "username": "stub_bot"}
+        return web.json_response({"ok": True, "result": result})
+
+    async def gemini_rest(request: web.Request) -> web.Response:
+        await request.read()
+        await asyncio.sleep(delay)
+        body = {"candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}}]}
+        return web.Response(text=json.dumps(body), content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/bot{token}/{method}", bot_api)
+    app.router.add_post("/v1beta/{name:.*}", gemini_rest)
+
+    ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ssl_context.load_cert_chain(cert, key)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, HOST, 0, ssl_context=ssl_context)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+async def start_grpc_stub(cert: str, key: str, delay: float) -> tuple[grpc.aio.Server, int]:
+    async def generate_content(request, context):
+        await asyncio.sleep(delay)
+        return glm.GenerateContentResponse(
+            candidates=[{"content": {"role": "model", "parts": [{"text": "ok"}]}}]
+        )
+
+    handler = grpc.method_handlers_generic_handler(GRPC_SERVICE, {
+        "GenerateContent": grpc.unary_unary_rpc_method_handler(
+            generate_content,
+            request_deserializer=glm.GenerateContentRequest.deserialize,
+            response_serializer=glm.GenerateContentResponse.serialize,
+        ),
+    })
+    with open(cert, "rb") as c, open(key, "rb") as k:
+        credentials = grpc.ssl_server_credentials([(k.read(), c.read())])
+
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_secure_port(f"{HOST}:0", credentials)
+    await server.start()
+    return server, port
+
+
+# --- Вимірювання ---
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable],
+    warm_up: Callable[[], Awaitable] | None,
+    requests: int,
+    burst: int,
+    delay: float,
+) -> None:
+    async def timed() -> float:
+        started = time.perf_counter()
+        await call()
+        return (time.perf_counter() - started - delay) * 1000
+
+    if warm_up is not None:
+        await warm_up()
+    cold = await timed()
+    sequential = [await timed() for _ in range(requests)]
+    burst_latencies = sorted(await asyncio.gather(*(timed() for _ in range(burst))))
+    p95 = burst_latencies[max(0, int(len(burst_latencies) * 0.95) - 1)]
+
+    print(
+        f"{name:<34} {cold:>9.2f} {statistics.mean(sequential):>9.2f} "
+        f"{statistics.median(burst_latencies):>11.2f} {p95:>11.2f}"
+    )
+
+
+def print_header(title: str) -> None:
+    print(f"\n{title}")
+    print(f"{'конфігурація':<34} {'cold, мс':>9} {'seq, мс':>9} {'burst p50':>11} {'burst p95':>11}")
+
+
+async def bench_telegram(port: int, cert: str, args: argparse.Namespace) -> None:
+    api = TelegramAPIServer.from_base(f"https://{HOST}:{port}")
+    ssl_context = ssl.create_default_context(cafile=cert)
+
+    def no_keepalive() -> AiohttpSession:
+        session = TunedAiohttpSession(api=api)
+        session._connector_init.pop("keepalive_timeout")
+        session._connector_init["force_close"] = True
+        return session
+
+    def tuned() -> AiohttpSession:
+        return TunedAiohttpSession(
+            limit=args.burst, keepalive_timeout=60.0, connect_timeout=10.0, dns_cache_ttl=3600, api=api
+        )
+
+    configurations = [
+        ("без keep-alive", no_keepalive, 0),
+        ("aiogram за замовчуванням", lambda: AiohttpSession(api=api), 0),
+        ("налаштована сесія", tuned, 0),
+        (f"налаштована + прогрів ({args.warmup})", tuned, args.warmup),
+    ]
+
+    print_header("Telegram Bot API (getMe)")
+    for name, factory, warmup in configurations:
+        session = factory()
+        session._connector_init["ssl"] = ssl_context
+        bot = Bot(token=BOT_TOKEN, session=session)
+        try:
+            await measure(
+                name, bot.get_me, (lambda: warm_up_bot(bot, warmup)) if warmup else None,
+                args.requests, args.burst, args.server_delay,
+            )
+        finally:
+            await session.close()
+
+
+def gemini_request() -> glm.GenerateContentRequest:
+    return glm.GenerateContentRequest(model="models/stub", contents=[{"role": "user", "parts": [{"text": "ping"}]}])
+
+
+async def bench_gemini_rest(port: int, cert: str, args: argparse.Namespace) -> None:
+    transport_kwargs = dict(host=f"{HOST}:{port}", credentials=AnonymousCredentials())
+    configurations = [
+        ("REST, пул за замовчуванням", lambda: GenerativeServiceRestTransport(**transport_kwargs), 0),
+        (f"REST, пул {args.burst}", lambda: make_gemini_transport("rest", rest_pool_size=args.burst)(**transport_kwargs), 0),
+        (f"REST, пул {args.burst} + прогрів ({args.warmup})",
+         lambda: make_gemini_transport("rest", rest_pool_size=args.burst)(**transport_kwargs), args.warmup),
+    ]
+
+    print_header("Gemini REST (generateContent, requests у потоках)")
+    for name, factory, warmup in configurations:
+        transport = factory()
+        # REQUESTS_CA_BUNDLE з оточення інакше перекриває verify
+        transport._session.trust_env = False
+        transport._session.verify = cert
+        client = glm.GenerativeServiceClient(transport=transport)
+
+        def call():
+            return asyncio.to_thread(client.generate_content, gemini_request())
+
+        async def warm_up():
+            await asyncio.gather(*(call() for _ in range(warmup)))
+
+        try:
+            await measure(name, call, warm_up if warmup else None, args.requests, args.burst, args.server_delay)
+        finally:
+            transport.close()
+
+
+async def bench_gemini_grpc(port: int, cert: str, args: argparse.Namespace) -> None:
+    with open(cert, "rb") as c:
+        root_certificates = c.read()
+
+    def transport_kwargs():
+        return dict(
+            host=f"{HOST}:{port}",
+            credentials=AnonymousCredentials(),
+            ssl_channel_credentials=grpc.ssl_channel_credentials(root_certificates),
+        )
+
+    configurations = [
+        ("grpc_asyncio за замовчуванням", lambda: GenerativeServiceGrpcAsyncIOTransport(**transport_kwargs()), False),
+        ("grpc_asyncio + keepalive", lambda: make_gemini_transport("grpc_asyncio", GRPC_OPTIONS)(**transport_kwargs()), False),
+        ("grpc_asyncio + keepalive + прогрів",
+         lambda: make_gemini_transport("grpc_asyncio", GRPC_OPTIONS)(**transport_kwargs()), True),
+    ]
+
+    print_header("Gemini gRPC (GenerateContent)")
+    for name, factory, warmup in configurations:
+        transport = factory()
+        client = glm.GenerativeServiceAsyncClient(transport=transport)
+
+        async def warm_up():
+            await transport.grpc_channel.channel_ready()
+
+        try:
+            await measure(
+                name, lambda: client.generate_content(gemini_request()),
+                warm_up if warmup else None, args.requests, args.burst, args.server_delay,
+            )
+        finally:
+            await transport.close()
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        runner, http_port = await start_http_stub(cert, key, args.server_delay)
+        grpc_server, grpc_port = await start_grpc_stub(cert, key, args.server_delay)
+        print(
+            f"Запитів послідовно: {args.requests}, пачка: {args.burst}, "
+            f"затримка сервера: {args.server_delay * 1000:.0f} мс (віднімається)"
+        )
+        try:
+            await bench_telegram(http_port, cert, args)
+            await bench_gemini_rest(http_port, cert, args)
+            await bench_gemini_grpc(grpc_port, cert, args)
+        finally:
+            await grpc_server.stop(None)
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50, help="кількість послідовних запитів")
+    parser.add_argument("--burst", type=int, default=64, help="розмір пачки паралельних запитів")
+    parser.add_argument("--warmup", type=int, default=8, help="скільки з'єднань відкривати при прогріві")
+    parser.add_argument("--server-delay", type=float, default=0.02, help="штучна затримка відповіді сервера, с")
+    asyncio.run(main(parser.parse_args()))
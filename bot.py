@@ -7,6 +7,8 @@ from aiogram.client.default import DefaultBotProperties
 from config import settings
 # Оновлений імпорт з нової структури
 from handlers.channel_handlers import channel_router
+from services import gemini_service
+from services.transport_service import TunedAiohttpSession, warm_up_bot
 
 async def main():
     logging.basicConfig(
@@ -14,8 +16,18 @@ async def main():
         format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
     )
     
+    session = TunedAiohttpSession(
+        limit=settings.TG_CONNECTION_LIMIT,
+        limit_per_host=settings.TG_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=settings.TG_KEEPALIVE_TIMEOUT,
+        connect_timeout=settings.TG_CONNECT_TIMEOUT,
+        read_timeout=settings.TG_READ_TIMEOUT,
+        dns_cache_ttl=settings.TG_DNS_CACHE_TTL,
+        timeout=settings.TG_REQUEST_TIMEOUT,
+    )
     bot = Bot(
         token=settings.BOT_TOKEN, 
+        session=session,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
     
@@ -23,6 +35,12 @@ async def main():
     dp.include_router(channel_router)
     
     await bot.delete_webhook(drop_pending_updates=True)
+
+    # Відкриваємо з'єднання наперед, щоб перший пост не чекав на TCP+TLS
+    await asyncio.gather(
+        warm_up_bot(bot, settings.TG_WARMUP_CONNECTIONS),
+        gemini_service.warm_up(),
+    )
     
     logging.info("Бот запускається...")
     await dp.start_polling(bot)
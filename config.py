@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
+from typing import Literal
 import logging
 
 class Settings(BaseSettings):
@@ -17,6 +18,28 @@ class Settings(BaseSettings):
     # Опціональні параметри
     LOG_LEVEL: str = "INFO"
     GEMINI_MODEL: str = "gemini-2.5-flash"
+
+    # HTTP-сесія Telegram Bot API (aiohttp)
+    TG_CONNECTION_LIMIT: int = 100          # Загальний ліміт з'єднань у пулі
+    TG_CONNECTION_LIMIT_PER_HOST: int = 0   # 0 = без окремого ліміту на хост
+    TG_KEEPALIVE_TIMEOUT: float = 60.0      # Скільки тримати idle-з'єднання відкритим
+    TG_CONNECT_TIMEOUT: float = 10.0        # Таймаут на TCP+TLS з'єднання
+    TG_REQUEST_TIMEOUT: float = 60.0        # Загальний таймаут запиту (для getUpdates до нього додається polling timeout)
+    TG_READ_TIMEOUT: float = 30.0           # Таймаут очікування даних із сокета; має бути більшим за polling timeout
+    TG_DNS_CACHE_TTL: int = 3600            # 0 = вимкнути кешування DNS
+    TG_WARMUP_CONNECTIONS: int = 2          # Скільки з'єднань відкрити наперед при старті
+
+    # Транспорт Gemini
+    GEMINI_TRANSPORT: Literal["grpc_asyncio", "rest"] = "grpc_asyncio"
+    GEMINI_TIMEOUT: float = 60.0            # Дедлайн одного виклику Gemini разом із внутрішніми повторами клієнта
+    GEMINI_REST_POOL_SIZE: int = 10         # Розмір пулу з'єднань для REST (requests)
+    GEMINI_GRPC_OPTIONS: dict[str, int | str] = {
+        "grpc.keepalive_time_ms": 30000,
+        "grpc.keepalive_timeout_ms": 10000,
+        "grpc.keepalive_permit_without_calls": 1,
+        "grpc.http2.max_pings_without_data": 0,
+    }
+    GEMINI_WARMUP_CONNECTIONS: int = 1      # Скільки запитів-прогрівів зробити при старті (0 = вимкнено)
     
     @field_validator('BOT_TOKEN')
     @classmethod
@@ -1,6 +1,10 @@
 # services/gemini_service.py
 
 import google.generativeai as genai
+from google.generativeai import client as genai_client
+from google.ai import generativelanguage_v1beta as glm
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as retries
 import logging
 import json
 import asyncio
@@ -13,12 +17,54 @@ from config import settings
 from models import PropertyData
 # Імпорт з поточної папки
 from .cache_service import cache
+from .transport_service import make_gemini_transport
 # Імпорт констант
 from utils.constants import RetryConfig
 
-# Налаштування
+# Налаштування. Транспорт сюди не передаємо: genai застосовує його до всіх клієнтів
+# (sync/async, усі сервіси), тому налаштований транспорт отримує лише клієнт моделі нижче.
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+_rest = settings.GEMINI_TRANSPORT == "rest"
+
+def _request_options(timeout: float) -> dict:
+    # timeout у GAPIC обмежує лише одну спробу, тому Retry з тим самим дедлайном
+    # обмежує весь виклик разом із внутрішніми повторами. Політика та сама, що й типова
+    # для GenerateContent (лише ServiceUnavailable), інакше 429 від квоти повторювались би до дедлайну.
+    retry_cls = retries.Retry if _rest else retries.AsyncRetry
+    retry = retry_cls(
+        predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable),
+        initial=1.0,
+        maximum=10.0,
+        multiplier=1.3,
+        timeout=timeout,
+    )
+    return {"timeout": timeout, "retry": retry}
+
+request_options = _request_options(settings.GEMINI_TIMEOUT)
+
+def _make_client(client_options: Optional[dict] = None):
+    """Створює клієнт GenerativeService з налаштованим пулом/каналом."""
+    transport = make_gemini_transport(
+        settings.GEMINI_TRANSPORT,
+        grpc_options=settings.GEMINI_GRPC_OPTIONS,
+        rest_pool_size=settings.GEMINI_REST_POOL_SIZE,
+    )
+    client_options = client_options or {"api_key": settings.GEMINI_API_KEY}
+    client_cls = glm.GenerativeServiceClient if _rest else glm.GenerativeServiceAsyncClient
+    # client_info з genai.configure несе user agent genai-py, як і в стандартних клієнтах
+    client_info = genai_client._client_manager.client_config.get("client_info")
+    return client_cls(transport=transport, client_options=client_options, client_info=client_info)
+
+def _attach_client() -> None:
+    # Створюємо ліниво: канал grpc.aio прив'язується до event loop, у якому його відкрили.
+    # Приватні _client/_async_client — поведінка google-generativeai==0.8.5 (див. requirements.txt), перевірити при оновленні.
+    if _rest:
+        if model._client is None:
+            model._client = _make_client()
+    elif model._async_client is None:
+        model._async_client = _make_client()
+
 # Висока температура для максимальної "людяності" і варіативності
 generation_config = genai.types.GenerationConfig(
     temperature=0.9,
@@ -41,6 +87,36 @@ def retry_on_error(max_retries=RetryConfig.MAX_RETRIES, delay=RetryConfig.RETRY_
         return wrapper
     return decorator
 
+async def _generate_content(prompt: str, **kwargs):
+    _attach_client()
+    # REST-транспорт синхронний (requests), тому виконуємо його в потоці, щоб не блокувати event loop
+    if _rest:
+        return await asyncio.to_thread(model.generate_content, prompt, request_options=request_options, **kwargs)
+    return await model.generate_content_async(prompt, request_options=request_options, **kwargs)
+
+async def warm_up(connections: int = settings.GEMINI_WARMUP_CONNECTIONS, timeout: float = 10.0) -> None:
+    """Відкриває з'єднання з Gemini наперед через безкоштовний count_tokens."""
+    if connections <= 0:
+        return
+    _attach_client()
+    # Без повторів і з коротким таймаутом, щоб недоступний Gemini не затримував старт бота
+    timeout = min(timeout, settings.GEMINI_TIMEOUT)
+    warm_up_options = {"timeout": timeout, "retry": None}
+    if _rest:
+        calls = [asyncio.to_thread(model.count_tokens, "ping", request_options=warm_up_options) for _ in range(connections)]
+    else:
+        calls = [model.count_tokens_async("ping", request_options=warm_up_options) for _ in range(connections)]
+    try:
+        # Страховка на випадок, якщо транспорт не дотримається таймауту (напр. DNS у потоці REST)
+        results = await asyncio.wait_for(asyncio.gather(*calls, return_exceptions=True), timeout)
+    except asyncio.TimeoutError:
+        results = [TimeoutError(f"перевищено {timeout}с")] * connections
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        logging.warning(f"Прогрів Gemini ({settings.GEMINI_TRANSPORT}): {len(failed)}/{connections} невдалих запитів: {failed[0]}")
+    else:
+        logging.info(f"Прогрів Gemini ({settings.GEMINI_TRANSPORT}): {connections} запитів успішно")
+
 @retry_on_error()
 async def extract_base_data(text: str) -> Optional[PropertyData]:
     if not text:
@@ -72,7 +148,7 @@ async def extract_base_data(text: str) -> Optional[PropertyData]:
     try:
         # Для вилучення фактів (JSON) нам потрібна точність
         json_gen_config = genai.types.GenerationConfig(response_mime_type="application/json", temperature=0.1)
-        response = await model.generate_content_async(prompt, generation_config=json_gen_config)
+        response = await _generate_content(prompt, generation_config=json_gen_config)
         
         raw_data = json.loads(response.text)
         validated_data = PropertyData(**raw_data)
@@ -170,7 +246,7 @@ async def generate_description(text: str, max_length: int, property_type: str, p
     Напиши ТІЛЬКИ текст оголошення, без коментарів.
     """
     try:
-        response = await model.generate_content_async(prompt)
+        response = await _generate_content(prompt)
         desc_text = response.text.strip()
         
         # Видаляємо рієлторські фрази, якщо AI все ж їх додав
@@ -0,0 +1,103 @@
+# services/transport_service.py
+
+import asyncio
+import logging
+from typing import Any, Callable, Mapping, Optional
+
+from aiohttp import ClientTimeout
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+from google.ai.generativelanguage_v1beta.services.generative_service.transports import (
+    GenerativeServiceGrpcAsyncIOTransport,
+    GenerativeServiceRestTransport,
+)
+from requests.adapters import HTTPAdapter
+
+
+class TunedAiohttpSession(AiohttpSession):
+    """AiohttpSession з налаштовуваним пулом з'єднань, keep-alive, DNS-кешем і таймаутами."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 60.0,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        dns_cache_ttl: int = 3600,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._connector_init.update(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            use_dns_cache=dns_cache_ttl > 0,
+            ttl_dns_cache=dns_cache_ttl or None,
+        )
+
+    async def make_request(
+        self, bot: Bot, method: TelegramMethod[TelegramType], timeout: Optional[int] = None
+    ) -> TelegramType:
+        # aiogram передає в aiohttp лише загальний таймаут, додаємо окремі таймаути на з'єднання і читання
+        total = self.timeout if timeout is None else timeout
+        client_timeout = ClientTimeout(
+            total=total, sock_connect=self.connect_timeout, sock_read=self.read_timeout
+        )
+        return await super().make_request(bot, method, timeout=client_timeout)  # type: ignore[arg-type]
+
+
+async def warm_up_bot(bot: Bot, connections: int) -> None:
+    """Відкриває з'єднання з Bot API наперед, щоб перші пости не платили за TCP+TLS."""
+    if connections <= 0:
+        return
+    # Паралельні запити змушують пул відкрити окреме з'єднання під кожен
+    results = await asyncio.gather(
+        *(bot.get_me() for _ in range(connections)), return_exceptions=True
+    )
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        logging.warning(f"Прогрів Bot API: {len(failed)}/{connections} невдалих запитів: {failed[0]}")
+    else:
+        logging.info(f"Прогрів Bot API: відкрито {connections} з'єднань")
+
+
+def make_gemini_transport(
+    transport: str,
+    grpc_options: Optional[Mapping[str, Any]] = None,
+    rest_pool_size: int = 10,
+) -> Callable[..., Any]:
+    """Повертає фабрику транспорту для GenerativeService з потрібними опціями пулу/каналу.
+
+    Фабрика викликається клієнтом google-ai-generativelanguage з тими ж аргументами,
+    що й клас транспорту (host, credentials, client_info, ...).
+    """
+    if transport == "rest":
+        def rest_transport(**kwargs: Any) -> GenerativeServiceRestTransport:
+            rest = GenerativeServiceRestTransport(**kwargs)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=rest_pool_size)
+            rest._session.mount("https://", adapter)
+            rest._session.mount("http://", adapter)
+            return rest
+
+        return rest_transport
+
+    if transport == "grpc_asyncio":
+        extra_options = list((grpc_options or {}).items())
+
+        def create_channel(*args: Any, options: Any = (), **kwargs: Any):
+            return GenerativeServiceGrpcAsyncIOTransport.create_channel(
+                *args, options=[*options, *extra_options], **kwargs
+            )
+
+        def grpc_transport(**kwargs: Any) -> GenerativeServiceGrpcAsyncIOTransport:
+            kwargs.setdefault("channel", create_channel)
+            return GenerativeServiceGrpcAsyncIOTransport(**kwargs)
+
+        return grpc_transport
+
+    raise ValueError(f"Невідомий транспорт Gemini: {transport}")
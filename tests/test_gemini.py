@@ -7,7 +7,11 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # ---------------------------
 
+import time
+
 import pytest
+from google.api_core import exceptions as core_exceptions
+from services import gemini_service
 from services.gemini_service import extract_base_data
 from models import PropertyData
 
@@ -36,4 +40,36 @@ async def test_extract_base_data_nonsense():
     # Очікуємо або None, або об'єкт з дефісами
     result = await extract_base_data(text)
     if result:
-        assert result.type == "-" or result.price == "-"
\ No newline at end of file
+        assert result.type == "-" or result.price == "-"
+
+@pytest.mark.asyncio
+async def test_warm_up_unreachable_host_respects_timeout():
+    # Недоступний Gemini не повинен затримувати старт бота довше за таймаут прогріву
+    model = gemini_service.model
+    saved = (model._client, model._async_client)
+    client = gemini_service._make_client({"api_key": "test", "api_endpoint": "127.0.0.1:1"})
+    if gemini_service._rest:
+        model._client = client
+    else:
+        model._async_client = client
+    try:
+        started = time.monotonic()
+        await gemini_service.warm_up(connections=2, timeout=1.0)
+        assert time.monotonic() - started < 3.0
+    finally:
+        model._client, model._async_client = saved
+
+def test_request_retry_keeps_default_policy():
+    # Повторюємо лише ServiceUnavailable, як типова політика GenerateContent; 429 від квоти — ні
+    retry = gemini_service.request_options["retry"]
+    assert retry._predicate(core_exceptions.ServiceUnavailable("unavailable"))
+    assert not retry._predicate(core_exceptions.ResourceExhausted("quota"))
+    assert not retry._predicate(core_exceptions.InternalServerError("internal"))
+    assert retry._timeout == gemini_service.settings.GEMINI_TIMEOUT
+
+@pytest.mark.asyncio
+async def test_model_client_keeps_genai_user_agent():
+    # Клієнт із налаштованим транспортом має підписувати запити так само, як стандартний клієнт genai
+    client = gemini_service._make_client({"api_key": "test", "api_endpoint": "127.0.0.1:1"})
+    wrapped = client.transport._wrapped_methods[client.transport.generate_content]
+    assert "genai-py/" in dict(wrapped._metadata)["x-goog-api-client"]
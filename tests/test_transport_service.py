@@ -0,0 +1,115 @@
+import sys
+import os
+
+# --- ВИПРАВЛЕННЯ ШЛЯХІВ ---
+# Додаємо кореневу папку проекту до системних шляхів,
+# щоб Python міг побачити папку 'services'
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# ---------------------------
+
+import grpc
+import pytest
+from aiohttp import ClientTimeout
+from aiogram import Bot
+from aiogram.methods import GetMe
+from google.auth.credentials import AnonymousCredentials
+
+from services import transport_service
+from services.transport_service import TunedAiohttpSession, make_gemini_transport
+
+
+def test_session_connector_settings():
+    session = TunedAiohttpSession(limit=7, limit_per_host=3, keepalive_timeout=42.0, dns_cache_ttl=120)
+    init = session._connector_init
+    assert init["limit"] == 7
+    assert init["limit_per_host"] == 3
+    assert init["keepalive_timeout"] == 42.0
+    assert init["use_dns_cache"] is True
+    assert init["ttl_dns_cache"] == 120
+
+
+def test_session_dns_cache_disabled():
+    init = TunedAiohttpSession(dns_cache_ttl=0)._connector_init
+    assert init["use_dns_cache"] is False
+    assert init["ttl_dns_cache"] is None
+
+
+class FakeResponse:
+    status = 200
+
+    async def text(self):
+        return '{"ok": true, "result": {"id": 42, "is_bot": true, "first_name": "Stub"}}'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeClientSession:
+    def __init__(self):
+        self.timeouts = []
+
+    def post(self, url, data=None, timeout=None):
+        self.timeouts.append(timeout)
+        return FakeResponse()
+
+
+@pytest.mark.asyncio
+async def test_make_request_sends_client_timeout():
+    session = TunedAiohttpSession(connect_timeout=5.0, read_timeout=15.0, timeout=60.0)
+    fake = FakeClientSession()
+
+    async def create_session():
+        return fake
+
+    session.create_session = create_session
+    bot = Bot(token="42:TEST", session=session)
+
+    user = await bot(GetMe())
+    await bot(GetMe(), request_timeout=70)
+
+    assert user.id == 42
+    assert fake.timeouts == [
+        ClientTimeout(total=60.0, sock_connect=5.0, sock_read=15.0),
+        ClientTimeout(total=70, sock_connect=5.0, sock_read=15.0),
+    ]
+
+
+def test_rest_transport_pool_size():
+    transport = make_gemini_transport("rest", rest_pool_size=25)(
+        host="localhost", credentials=AnonymousCredentials()
+    )
+    try:
+        adapter = transport._session.get_adapter("https://localhost/")
+        assert adapter._pool_maxsize == 25
+    finally:
+        transport.close()
+
+
+@pytest.mark.asyncio
+async def test_grpc_transport_channel_options(monkeypatch):
+    captured = {}
+
+    def create_channel(*args, options=(), **kwargs):
+        captured["options"] = options
+        return grpc.aio.insecure_channel("127.0.0.1:1")
+
+    monkeypatch.setattr(
+        transport_service.GenerativeServiceGrpcAsyncIOTransport, "create_channel", create_channel
+    )
+    transport = make_gemini_transport("grpc_asyncio", {"grpc.keepalive_time_ms": 1234})(
+        host="localhost", credentials=AnonymousCredentials()
+    )
+    try:
+        assert ("grpc.keepalive_time_ms", 1234) in captured["options"]
+        # Власні опції GAPIC теж зберігаються
+        assert ("grpc.max_send_message_length", -1) in captured["options"]
+    finally:
+        await transport.close()
+
+
+def test_unknown_gemini_transport():
+    with pytest.raises(ValueError):
+        make_gemini_transport("bogus")